@@ -20,10 +20,16 @@
 import time
 import math 
 import os 
+import struct
+import queue
+import threading
+import atexit
+from contextlib import contextmanager
+from functools import lru_cache
 from pinpong.board import Board, Pin, SPI 
 
 try:
-    from PIL import Image, ImageDraw, ImageFont
+    from PIL import Image, ImageDraw, ImageFont, ImageChops
     _HAS_PIL = True
 except ImportError:
     _HAS_PIL = False
@@ -33,6 +39,73 @@ except ImportError:
     print("Please install it on your Unihiker: pip install Pillow")
     print("--------------------------------------------------------------------")
 
+try:
+    import numpy as np # Optional: vectorized RGB565 packing
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+# --- RGB565 byte-packing lookup tables (used with Image.point) ---
+# High byte: RRRRRGGG, low byte: GGGBBBBB. Each byte is the sum of two
+# single-channel lookups whose bits never overlap.
+_LUT_R_HI = [v & 0xF8 for v in range(256)]
+_LUT_G_HI = [v >> 5 for v in range(256)]
+_LUT_G_LO = [(v & 0x1C) << 3 for v in range(256)]
+_LUT_B_LO = [v >> 3 for v in range(256)]
+_LUT_RGB_SPLIT = _LUT_R_HI + _LUT_G_HI + _LUT_B_LO # One multi-band point() call for three of the four lookups
+
+# --- Cached scalar color conversions (only 65,536 possible RGB565 inputs) ---
+# 5/6-bit channel -> 8-bit expansion tables (rounded, so 31 -> 255 and 63 -> 255)
+_R5_TO_8 = tuple((i * 255 + 15) // 31 for i in range(32))
+_G6_TO_8 = tuple((i * 255 + 31) // 63 for i in range(64))
+_B5_TO_8 = _R5_TO_8
+
+@lru_cache(maxsize=None)
+def _rgb565_to_rgb888(color_rgb565):
+    return (_R5_TO_8[(color_rgb565 >> 11) & 0x1F], _G6_TO_8[(color_rgb565 >> 5) & 0x3F], _B5_TO_8[color_rgb565 & 0x1F])
+
+@lru_cache(maxsize=4096)
+def _rgb888_to_rgb565(rgb_tuple):
+    r, g, b = rgb_tuple
+    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+
+@lru_cache(maxsize=4)
+def _rgb565_fill_payload(color_rgb565, screen_pixels):
+    """
+    One RGB565 color repeated over a whole screen, MSB-first. Cached per color, not per size:
+    a fill of any size sends a memoryview slice of it, so fills that change size still hit.
+    """
+    return struct.pack(">H", color_rgb565) * screen_pixels
+
+def _rgb888_array_to_rgb565(arr):
+    """Vectorized RGB888 -> RGB565 for a (..., 3) uint8 NumPy array; returns native uint16 values. Needs NumPy."""
+    out = arr[..., 0].astype(np.uint16); out &= 0xF8; out <<= 8 # In-place ops: one uint16 buffer instead of one per term
+    out |= (arr[..., 1] & np.uint8(0xFC)).astype(np.uint16) << 3
+    out |= arr[..., 2] >> 3
+    return out
+
+@lru_cache(maxsize=16)
+def _load_font(font_path, font_size):
+    """Loaded FreeType fonts, shared by all instances; bounded so cycling through sizes cannot grow memory forever."""
+    return ImageFont.truetype(font_path, font_size)
+
+# One reusable 1x1 canvas for text measurement on old Pillow (textsize), instead of a new image + Draw per call
+_MEASURE_DRAW = ImageDraw.Draw(Image.new("RGB", (1, 1))) if _HAS_PIL else None
+
+def _find_pil_rgb565_rawmode():
+    """Returns a Pillow raw mode that packs RGB straight to MSB-first RGB565, or None if this Pillow has none."""
+    if not _HAS_PIL: return None
+    probe_pixels = ((0xF8, 0x1C, 0x07), (0x07, 0xE0, 0x18), (0x10, 0x04, 0xF8))
+    probe = Image.frombytes("RGB", (3, 1), bytes(c for p in probe_pixels for c in p)) # No putdata()/getdata(): getdata() is deprecated
+    expected = b"".join(struct.pack(">H", _rgb888_to_rgb565(p)) for p in probe_pixels)
+    for rawmode in ("BGR;16", "RGB;16", "RGB;16B"):
+        try:
+            if probe.tobytes("raw", rawmode) == expected: return rawmode # Byte order checked, not assumed
+        except ValueError: pass # No packer for this raw mode
+    return None
+
+_PIL_RGB565_RAWMODE = _find_pil_rgb565_rawmode()
+
 # --- GC9A01 Command Definitions ---
 CMD_NOP = 0x00; CMD_SWRESET = 0x01; CMD_SLPIN = 0x10; CMD_SLPOUT = 0x11
 CMD_INVOFF = 0x20; CMD_INVON = 0x21; CMD_DISPOFF = 0x28; CMD_DISPON = 0x29
@@ -41,9 +114,34 @@ CMD_MADCTL = 0x36; CMD_TEON = 0x35
 CMD_INTER_REGISTER_ENABLE_1 = 0xFE; CMD_INTER_REGISTER_ENABLE_2 = 0xEF
 
 class GC9A01:
-    SPI_CHUNK_SIZE_BYTES = 4096 
-
-    def __init__(self, spi_bus, dc_pin_obj, rst_pin_obj, cs_pin_obj=None, bl_pin_obj=None, width=240, height=240, madctl_val=0x08):
+    SPI_CHUNK_SIZE_BYTES = 4096 # Conservative default; raised to spidev's bufsiz when it can be read
+    SPIDEV_BUFSIZ_PATH = "/sys/module/spidev/parameters/bufsiz"
+    SPI_CHUNK_SIZE_MAX = 65536
+
+    DIRTY_MERGE_SLACK_PX = 256 # Extra pixels worth sending to save a separate window transfer
+
+    SPI_QUEUE_DEPTH = 4 # Region transfers that may be in flight when async_spi is enabled
+    ASYNC_STRIP_BYTES = 16384 # With async_spi, large regions are packed and queued in strips of about this size
+    RAW_SPIDEV_ATTRS = ("_spi", "spi", "obj", "_obj", "dev") # Where SPI wrappers commonly keep their spidev handle
+
+    # Vendor init sequence as (command, argument bytes); None marks MADCTL, filled in from madctl_val
+    _INIT_SEQUENCE = (
+        (0xEF, b''), (0xEB, b'\x14'), (CMD_INTER_REGISTER_ENABLE_1, b''), (CMD_INTER_REGISTER_ENABLE_2, b''),
+        (0xEB, b'\x14'), (0x84, b'\x40'), (0x85, b'\xFF'), (0x86, b'\xFF'), (0x87, b'\xFF'), (0x88, b'\x0A'),
+        (0x89, b'\x21'), (0x8A, b'\x00'), (0x8B, b'\x80'), (0x8C, b'\x01'), (0x8D, b'\x01'), (0x8E, b'\xFF'),
+        (0x8F, b'\xFF'), (0xB6, b'\x00\x20'), (CMD_MADCTL, None), (CMD_PIXFMT, b'\x05'), (0x90, b'\x08\x08\x08\x08'),
+        (0xBD, b'\x06'), (0xBC, b'\x00'), (0xFF, b'\x60\x01\x04'), (0xC3, b'\x13'), (0xC4, b'\x13'), (0xC9, b'\x22'),
+        (0xBE, b'\x11'), (0xE1, b'\x10\x0E'), (0xDF, b'\x21\x0c\x02'), (0xF0, b'\x45\x09\x08\x08\x26\x2A'),
+        (0xF1, b'\x43\x70\x72\x36\x37\x6F'), (0xF2, b'\x45\x09\x08\x08\x26\x2A'), (0xF3, b'\x43\x70\x72\x36\x37\x6F'),
+        (0xED, b'\x1B\x0B'), (0xAE, b'\x77'), (0xCD, b'\x63'), (0x70, b'\x07\x07\x04\x0E\x0F\x09\x07\x08\x03'),
+        (0xE8, b'\x34'), (0x62, b'\x18\x0D\x71\xED\x70\x70\x18\x0F\x71\xEF\x70\x70'),
+        (0x63, b'\x18\x11\x71\xF1\x70\x70\x18\x13\x71\xF3\x70\x70'), (0x64, b'\x28\x29\xF1\x01\xF1\x00\x07'),
+        (0x66, b'\x3C\x00\xCD\x67\x45\x45\x10\x00\x00\x00'), (0x67, b'\x00\x3C\x00\x00\x00\x01\x54\x10\x32\x98'),
+        (0x74, b'\x10\x85\x80\x00\x00\x4E\x00'), (0x98, b'\x3e\x07'), (CMD_TEON, b''), (CMD_INVON, b''),
+    )
+
+    def __init__(self, spi_bus, dc_pin_obj, rst_pin_obj, cs_pin_obj=None, bl_pin_obj=None, width=240, height=240, madctl_val=0x08,
+                 async_spi=False, baudrate=None, auto_flush=True):
         self.spi = spi_bus
         self.width = width
         self.height = height
@@ -54,106 +152,202 @@ class GC9A01:
         self.cs = cs_pin_obj
         if self._manual_cs: self.cs.value(1)
         self.bl = bl_pin_obj 
+        self._spi_needs_list = False # Set if the SPI driver rejects bytes-like buffers
+        self._raw_spidev = self._find_raw_spidev() # py-spidev handle for zero-conversion writebytes2(), if reachable
+        if baudrate is not None:
+            if self._raw_spidev is not None:
+                try: self._raw_spidev.max_speed_hz = int(baudrate)
+                except Exception as e: print(f"Warning: could not set SPI baudrate to {baudrate}: {e}")
+            else: print("Warning: baudrate ignored, no spidev handle found; set it when creating the SPI object.")
+        self.SPI_CHUNK_SIZE_BYTES = self._detect_spi_chunk_size()
         if self.dc: self.dc.value(0)
 
+        # Optional background writer: pixel transfers are queued so the caller can keep
+        # drawing and packing while the previous region is still being clocked out.
+        self._spi_q = None
+        self._spi_errors = 0 # Failed background transfers, so a flush that raced one doesn't mark fb565 as on-panel
+        if async_spi:
+            self._spi_q = queue.Queue(maxsize=self.SPI_QUEUE_DEPTH)
+            threading.Thread(target=self._spi_worker, daemon=True).start()
+            atexit.register(self._wait_spi_idle) # The daemon writer would otherwise be killed with the last frame still queued
+
+        self._last_window = None # Column/page range currently set on the controller, None = unknown
+        self._dirty_rects = [] # Pending (x0, y0, x1, y1) regions, exclusive end
+        self._auto_flush = auto_flush # Send every change immediately unless inside batch(); False = only on flush()
         self.framebuffer = None
+        self.fb565 = bytearray(self.width * self.height * 2) # RGB565 (MSB-first) mirror of the framebuffer
+        self._fb565_on_panel = False # True once fb565 is known to match the panel's RAM, enabling changed-pixel diffs
+        self._rgb565_scratch = bytearray(self.width * self.height * 2) # Reused packing buffer; queued transfers take a copy
         if _HAS_PIL:
             self.framebuffer = Image.new("RGB", (self.width, self.height), (0, 0, 0)) # Default to black
             self.fb_draw = ImageDraw.Draw(self.framebuffer)
         else:
             print("Error: Pillow not found. Software framebuffer and advanced drawing disabled.")
 
-    def _rgb565_to_rgb888_tuple(self, color_rgb565):
-        r8 = (color_rgb565 & 0xF800) >> 11; g8 = (color_rgb565 & 0x07E0) >> 5; b8 = (color_rgb565 & 0x001F)
-        r8 = (r8 * 255 + 15) // 31; g8 = (g8 * 255 + 31) // 63; b8 = (b8 * 255 + 15) // 31
-        return (r8, g8, b8)
+    def _find_raw_spidev(self):
+        """Returns the py-spidev object behind the SPI wrapper (anything with writebytes2), or None."""
+        candidates = [self.spi] + [getattr(self.spi, name, None) for name in self.RAW_SPIDEV_ATTRS]
+        for candidate in candidates:
+            if candidate is not None and hasattr(candidate, "writebytes2"): return candidate
+        return None
+
+    def _detect_spi_chunk_size(self):
+        """Largest single transfer spidev accepts (its bufsiz), so a full frame needs only a few writes."""
+        try:
+            with open(self.SPIDEV_BUFSIZ_PATH) as f: bufsiz = int(f.read().strip())
+        except (OSError, ValueError):
+            return self.SPI_CHUNK_SIZE_BYTES
+        return max(1, min(self.SPI_CHUNK_SIZE_MAX, bufsiz))
+
+    # Bound straight to the cached module function: one C-level cache lookup per call, no extra Python frame
+    _rgb565_to_rgb888_tuple = staticmethod(_rgb565_to_rgb888)
 
     def _rgb888_tuple_to_rgb565_int(self, rgb_tuple):
         if rgb_tuple is None: return None 
-        r, g, b = rgb_tuple
-        return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        return _rgb888_to_rgb565(tuple(rgb_tuple))
 
     def _pil_image_to_rgb565_bytearray(self, pil_image):
         if pil_image.mode == "RGBA":
             # print("Warning: _pil_image_to_rgb565_bytearray received RGBA, flattening to black.")
             background = Image.new("RGB", pil_image.size, (0,0,0)) 
-            background.paste(pil_image, mask=pil_image.split()[3]) 
+            background.paste(pil_image, mask=pil_image) # RGBA image as its own mask, no split() of all four bands
             img_rgb = background
         elif pil_image.mode != "RGB":
             img_rgb = pil_image.convert("RGB")
         else:
             img_rgb = pil_image
-        
+
         buffer = bytearray(img_rgb.width * img_rgb.height * 2)
-        idx = 0
-        for y_coord in range(img_rgb.height):
-            for x_coord in range(img_rgb.width):
-                r, g, b = img_rgb.getpixel((x_coord, y_coord))
-                rgb565_color = self._rgb888_tuple_to_rgb565_int((r,g,b))
-                buffer[idx] = (rgb565_color >> 8) & 0xFF
-                buffer[idx+1] = rgb565_color & 0xFF
-                idx += 2
+        self._pack_rgb565_into(memoryview(buffer), img_rgb)
         return buffer
 
+    def _pack_rgb565_into(self, dst_mv, img_rgb):
+        """Packs an RGB image as MSB-first RGB565 into a caller-supplied writable buffer of w*h*2 bytes."""
+        if _HAS_NUMPY:
+            out = np.frombuffer(dst_mv, dtype='>u2').reshape(img_rgb.height, img_rgb.width)
+            out[...] = _rgb888_array_to_rgb565(np.asarray(img_rgb, dtype=np.uint8))
+            return
+
+        if _PIL_RGB565_RAWMODE:
+            dst_mv[:] = img_rgb.tobytes("raw", _PIL_RGB565_RAWMODE); return
+
+        # Pillow fallback: build the two RGB565 bytes as "L" bands in C and
+        # interleave them with an "LA" merge, no per-pixel Python work.
+        r_hi, g_hi, b_lo = img_rgb.point(_LUT_RGB_SPLIT).split()
+        hi = ImageChops.add(r_hi, g_hi)
+        lo = ImageChops.add(img_rgb.getchannel(1).point(_LUT_G_LO), b_lo)
+        dst_mv[:] = Image.merge("LA", (hi, lo)).tobytes()
+
     def _cs_low(self): 
         if self._manual_cs and self.cs: self.cs.value(0)
     def _cs_high(self): 
         if self._manual_cs and self.cs: self.cs.value(1)
+    def _spi_write(self, data):
+        """Writes a bytes-like buffer as-is, falling back to a list only if the SPI driver requires one."""
+        if self._raw_spidev is not None:
+            self._raw_spidev.writebytes2(data); return # Takes any buffer object, no per-byte conversion
+        if not self._spi_needs_list:
+            try: self.spi.write(data); return
+            except TypeError: self._spi_needs_list = True
+        self.spi.write(list(data))
     def _write_cmd_bytes_data(self, cmd, data_bytes=None): 
+        self._wait_spi_idle()
         self._cs_low(); self.dc.value(0); self.spi.write([cmd]) 
-        if data_bytes is not None: self.dc.value(1); self.spi.write(list(data_bytes)) 
+        if data_bytes is not None: self.dc.value(1); self._spi_write(data_bytes) 
         self._cs_high()
     def _write_cmd_no_args(self, cmd): 
+        self._wait_spi_idle()
         self._cs_low(); self.dc.value(0); self.spi.write([cmd]); self._cs_high()
     def _write_cmd_single_arg(self, cmd, arg): 
+        self._wait_spi_idle()
         self._cs_low(); self.dc.value(0); self.spi.write([cmd])
         self.dc.value(1); self.spi.write([arg]); self._cs_high()
     def _write_data(self, data_input): 
+        self._fb565_on_panel = False # Data written here bypasses fb565
+        self._wait_spi_idle()
         self._cs_low(); self.dc.value(1) 
-        if isinstance(data_input, (bytes, bytearray)):
-            for i in range(0, len(data_input), self.SPI_CHUNK_SIZE_BYTES):
-                self.spi.write(list(data_input[i:i + self.SPI_CHUNK_SIZE_BYTES])) 
+        self._stream_data(data_input)
+        self._cs_high()
+    def _stream_data(self, data_input):
+        """Sends data bytes in chunks; the caller owns CS and must have set DC high."""
+        if isinstance(data_input, (bytes, bytearray, memoryview)):
+            mv = memoryview(data_input) # Slicing a memoryview does not copy
+            for i in range(0, len(mv), self.SPI_CHUNK_SIZE_BYTES):
+                self._spi_write(mv[i:i + self.SPI_CHUNK_SIZE_BYTES])
         elif isinstance(data_input, list): self.spi.write(data_input) 
         else: print(f"Error: _write_data expects list, bytes or bytearray, got {type(data_input)}")
+    def _set_window_and_ramwr(self, x_start, y_start, x_end, y_end):
+        """
+        CASET + RASET + RAMWR in a single chip-select transaction, only toggling DC
+        between command and argument bytes. Coordinates must already be on-screen.
+        Leaves CS asserted and DC high so pixel data can follow via _stream_data().
+        CASET/RASET are skipped when the controller already holds this window, since
+        RAMWR alone restarts writing at the window origin.
+        """
+        self._cs_low()
+        window = (x_start, y_start, x_end, y_end)
+        if window != self._last_window:
+            self.dc.value(0); self.spi.write([CMD_CASET])
+            self.dc.value(1); self._spi_write(struct.pack(">HH", x_start, x_end))
+            self.dc.value(0); self.spi.write([CMD_RASET])
+            self.dc.value(1); self._spi_write(struct.pack(">HH", y_start, y_end))
+            self._last_window = window
+        self.dc.value(0); self.spi.write([CMD_RAMWR])
+        self.dc.value(1)
+    def _write_window(self, x_start, y_start, x_end, y_end, payload):
+        self._set_window_and_ramwr(x_start, y_start, x_end, y_end)
+        self._stream_data(payload)
         self._cs_high()
+    def _send_window(self, x_start, y_start, x_end, y_end, payload):
+        """Writes RGB565 pixels to an on-screen window, via the background writer when async_spi is on."""
+        if self._spi_q is None:
+            self._write_window(x_start, y_start, x_end, y_end, payload); return
+        # payload usually aliases fb565 or the packing scratch buffer, so queue a private copy
+        self._spi_q.put((x_start, y_start, x_end, y_end, bytes(payload)))
+    def _spi_worker(self):
+        while True:
+            x_start, y_start, x_end, y_end, payload = self._spi_q.get()
+            try: self._write_window(x_start, y_start, x_end, y_end, payload)
+            except Exception as e:
+                print(f"Error in background SPI writer: {e}")
+                self._spi_errors += 1; self._fb565_on_panel = False # This region never reached the panel
+            finally: self._spi_q.task_done()
+    def _wait_spi_idle(self):
+        """
+        Blocks until queued pixel transfers are done. Called before any other SPI
+        traffic, so commands never interleave with (or overtake) queued pixels.
+        """
+        if self._spi_q is not None: self._spi_q.join()
 
     def reset(self): 
+        self._wait_spi_idle() # Queued transfers must finish first, or the writer could set _last_window after it is cleared below
+        self._last_window = None # Hardware reset restores the default window
+        self._fb565_on_panel = False # ...and leaves panel RAM undefined
         if self.rst: self.rst.value(1); time.sleep(0.01); self.rst.value(0); time.sleep(0.01); self.rst.value(1); time.sleep(0.01) 
         else: print("Warning: Reset pin not configured.")
 
     def init_display(self):
         self.reset()
         time.sleep(0.100) 
-        # (Full init sequence from previous "clean" version)
-        self._write_cmd_no_args(0xEF); self._write_cmd_single_arg(0xEB, 0x14)
-        self._write_cmd_no_args(CMD_INTER_REGISTER_ENABLE_1); self._write_cmd_no_args(CMD_INTER_REGISTER_ENABLE_2)
-        self._write_cmd_single_arg(0xEB, 0x14); self._write_cmd_single_arg(0x84, 0x40) 
-        self._write_cmd_single_arg(0x85, 0xFF); self._write_cmd_single_arg(0x86, 0xFF) 
-        self._write_cmd_single_arg(0x87, 0xFF); self._write_cmd_single_arg(0x88, 0x0A)
-        self._write_cmd_single_arg(0x89, 0x21); self._write_cmd_single_arg(0x8A, 0x00)
-        self._write_cmd_single_arg(0x8B, 0x80); self._write_cmd_single_arg(0x8C, 0x01) 
-        self._write_cmd_single_arg(0x8D, 0x01); self._write_cmd_single_arg(0x8E, 0xFF) 
-        self._write_cmd_single_arg(0x8F, 0xFF); self._write_cmd_bytes_data(0xB6, b'\x00\x20') 
-        self._write_cmd_single_arg(CMD_MADCTL, self.madctl_val); self._write_cmd_single_arg(CMD_PIXFMT, 0x05)
-        self._write_cmd_bytes_data(0x90, b'\x08\x08\x08\x08'); self._write_cmd_single_arg(0xBD, 0x06)
-        self._write_cmd_single_arg(0xBC, 0x00); self._write_cmd_bytes_data(0xFF, b'\x60\x01\x04') 
-        self._write_cmd_single_arg(0xC3, 0x13); self._write_cmd_single_arg(0xC4, 0x13) 
-        self._write_cmd_single_arg(0xC9, 0x22); self._write_cmd_single_arg(0xBE, 0x11)
-        self._write_cmd_bytes_data(0xE1, b'\x10\x0E'); self._write_cmd_bytes_data(0xDF, b'\x21\x0c\x02')
-        self._write_cmd_bytes_data(0xF0, b'\x45\x09\x08\x08\x26\x2A'); self._write_cmd_bytes_data(0xF1, b'\x43\x70\x72\x36\x37\x6F')
-        self._write_cmd_bytes_data(0xF2, b'\x45\x09\x08\x08\x26\x2A'); self._write_cmd_bytes_data(0xF3, b'\x43\x70\x72\x36\x37\x6F')
-        self._write_cmd_bytes_data(0xED, b'\x1B\x0B'); self._write_cmd_single_arg(0xAE, 0x77)
-        self._write_cmd_single_arg(0xCD, 0x63); self._write_cmd_bytes_data(0x70, b'\x07\x07\x04\x0E\x0F\x09\x07\x08\x03')
-        self._write_cmd_single_arg(0xE8, 0x34); self._write_cmd_bytes_data(0x62, b'\x18\x0D\x71\xED\x70\x70\x18\x0F\x71\xEF\x70\x70')
-        self._write_cmd_bytes_data(0x63, b'\x18\x11\x71\xF1\x70\x70\x18\x13\x71\xF3\x70\x70'); self._write_cmd_bytes_data(0x64, b'\x28\x29\xF1\x01\xF1\x00\x07')
-        self._write_cmd_bytes_data(0x66, b'\x3C\x00\xCD\x67\x45\x45\x10\x00\x00\x00'); self._write_cmd_bytes_data(0x67, b'\x00\x3C\x00\x00\x00\x01\x54\x10\x32\x98')
-        self._write_cmd_bytes_data(0x74, b'\x10\x85\x80\x00\x00\x4E\x00'); self._write_cmd_bytes_data(0x98, b'\x3e\x07')
-        self._write_cmd_no_args(CMD_TEON); self._write_cmd_no_args(CMD_INVON)  
-        self._write_cmd_no_args(CMD_SLPOUT); time.sleep(0.12) 
+        # Constant command stream sent in one chip-select transaction, only toggling DC
+        self._wait_spi_idle()
+        self._cs_low()
+        cmd_run = bytearray() # Back-to-back command bytes (argument-less commands) share one DC-low write
+        for cmd, data in self._INIT_SEQUENCE:
+            if data is None: data = bytes([self.madctl_val])
+            cmd_run.append(cmd)
+            if data:
+                self.dc.value(0); self._spi_write(cmd_run); cmd_run = bytearray()
+                self.dc.value(1); self._spi_write(data)
+        cmd_run.append(CMD_SLPOUT) # Joins the trailing TEON/INVON run; only DISPON has to wait for the wake-up delay
+        self.dc.value(0); self._spi_write(cmd_run)
+        self._cs_high()
+        time.sleep(0.12) 
         self._write_cmd_no_args(CMD_DISPON); time.sleep(0.02) 
         if self.bl: self.backlight_on()
         if self.framebuffer: # Initialize framebuffer to black upon display init
             self.fb_draw.rectangle([(0,0), (self.width, self.height)], fill=(0,0,0))
+            self.fb565[:] = bytes(len(self.fb565))
         print("GC9A01 display initialized.")
         
     def display_on(self):
@@ -172,26 +366,153 @@ class GC9A01:
         if y_start > y_end: y_start, y_end = y_end, y_start
         self._write_cmd_bytes_data(CMD_CASET, bytes([(x_start>>8)&0xFF, x_start&0xFF, (x_end>>8)&0xFF, x_end&0xFF]))
         self._write_cmd_bytes_data(CMD_RASET, bytes([(y_start>>8)&0xFF, y_start&0xFF, (y_end>>8)&0xFF, y_end&0xFF]))
+        self._last_window = (x_start, y_start, x_end, y_end)
     
     def write_ram_prepare(self): 
+        self._fb565_on_panel = False # Raw pixel data follows that fb565 never sees, so diffs against it would skip repaints
         self._write_cmd_no_args(CMD_RAMWR)
 
-    def _update_framebuffer_region(self, x, y, width, height):
-        """Helper to update a region of the physical display from the software framebuffer."""
-        if not self.framebuffer or not _HAS_PIL: return
+    def _store_fb565_region(self, x, y, width, height, region565):
+        """Copies a packed RGB565 region into the persistent fb565 buffer at the screen stride."""
+        stride = self.width * 2; row_bytes = width * 2
+        src = memoryview(region565)
+        if width == self.width:
+            self.fb565[y * stride:(y + height) * stride] = src; return
+        if _HAS_NUMPY: # One strided C copy into a (H, W*2) byte view instead of a slice per row
+            dst_view = np.frombuffer(self.fb565, dtype=np.uint8).reshape(self.height, stride)
+            dst_view[y:y + height, x * 2:x * 2 + row_bytes] = np.frombuffer(src, dtype=np.uint8).reshape(height, row_bytes)
+            return
+        dst = (y * self.width + x) * 2
+        for row in range(height):
+            self.fb565[dst:dst + row_bytes] = src[row * row_bytes:(row + 1) * row_bytes]
+            dst += stride
+
+    def _pack_rgb565_from_fb(self, x, y, width, height, dst_mv):
+        """
+        Packs a region of the software framebuffer to RGB565 into dst_mv. np.asarray() on a
+        Pillow image always copies the whole image, so slicing it would cost more than a crop
+        for small regions; the crop is skipped only when the region is the full frame.
+        """
+        if x == 0 and y == 0 and width == self.width and height == self.height:
+            self._pack_rgb565_into(dst_mv, self.framebuffer)
+        else:
+            self._pack_rgb565_into(dst_mv, self.framebuffer.crop((x, y, x + width, y + height)))
+
+    @staticmethod
+    def _clip(x, y, width, height, screen_w, screen_h):
+        """
+        Clips a rect to the screen. Returns None if nothing is visible, else
+        (x, y, width, height, src_x_offset, src_y_offset) of the visible part.
+        """
         x, y, width, height = int(x), int(y), int(width), int(height)
-        x = max(0, min(x, self.width -1))
-        y = max(0, min(y, self.height -1))
-        width = max(0, min(width, self.width - x))
-        height = max(0, min(height, self.height - y))
-        if width == 0 or height == 0: return
+        x0, y0 = max(0, x), max(0, y)
+        w, h = min(x + width, screen_w) - x0, min(y + height, screen_h) - y0
+        if w <= 0 or h <= 0: return None
+        return x0, y0, w, h, x0 - x, y0 - y
 
+    def _update_framebuffer_region(self, x, y, width, height):
+        """
+        Helper to update a region of the physical display from the software framebuffer.
+        The region must already be clipped to the screen (dirty rects always are).
+        Returns False if the region could not be sent.
+        """
+        if not self.framebuffer or not _HAS_PIL: return False
         try:
-            region_img = self.framebuffer.crop((x, y, x + width, y + height))
-            rgb565_buffer = self._pil_image_to_rgb565_bytearray(region_img)
-            self.draw_image_rgb565(x, y, width, height, rgb565_buffer)
+            if self._fb565_on_panel and _HAS_NUMPY:
+                self._send_changed_region(x, y, width, height); return True
+            if width == self.width: # Full-width rows are contiguous in fb565: pack into it and send from it
+                rgb565_buffer = memoryview(self.fb565)[y * self.width * 2:(y + height) * self.width * 2]
+                self._pack_rgb565_from_fb(x, y, width, height, rgb565_buffer)
+            else:
+                rgb565_buffer = memoryview(self._rgb565_scratch)[:width * height * 2]
+                self._pack_rgb565_from_fb(x, y, width, height, rgb565_buffer)
+                self._store_fb565_region(x, y, width, height, rgb565_buffer)
+            self._send_window(x, y, x + width - 1, y + height - 1, rgb565_buffer)
+            return True
         except Exception as e:
             print(f"Error updating framebuffer region to hardware: {e}")
+            self._fb565_on_panel = False # fb565 may already hold pixels the panel never got
+            return False
+
+    def _send_changed_region(self, x, y, width, height):
+        """
+        Packs a region and sends only the bounding box of the pixels that differ from fb565, i.e.
+        from what the panel already shows. A region redrawn with identical pixels sends nothing.
+        """
+        packed_mv = memoryview(self._rgb565_scratch)[:width * height * 2]
+        self._pack_rgb565_from_fb(x, y, width, height, packed_mv)
+        new = np.frombuffer(packed_mv, dtype='>u2').reshape(height, width)
+        old = np.frombuffer(self.fb565, dtype='>u2').reshape(self.height, self.width)[y:y + height, x:x + width]
+        changed = new != old
+        rows = np.flatnonzero(changed.any(axis=1))
+        if rows.size == 0: return
+        cols = np.flatnonzero(changed.any(axis=0))
+        r0, r1, c0, c1 = int(rows[0]), int(rows[-1]) + 1, int(cols[0]), int(cols[-1]) + 1
+        old[r0:r1, c0:c1] = new[r0:r1, c0:c1]
+        if c0 == 0 and c1 == width: payload = packed_mv[r0 * width * 2:r1 * width * 2] # Whole rows: contiguous already
+        else: payload = new[r0:r1, c0:c1].tobytes()
+        self._send_window(x + c0, y + r0, x + c1 - 1, y + r1 - 1, payload)
+
+    def _mark_dirty(self, x, y, width, height):
+        """Records a changed framebuffer region; sends it right away unless a batch is open."""
+        clipped = self._clip(x, y, width, height, self.width, self.height)
+        if clipped is None: return
+        x0, y0, w, h = clipped[:4]
+        x1, y1 = x0 + w, y0 + h
+        rects = self._dirty_rects
+        merged = True
+        while merged:
+            # Absorb every pending rect whose union with the new one costs little more than sending both
+            merged = False
+            for i, (dx0, dy0, dx1, dy1) in enumerate(rects):
+                ux0, uy0, ux1, uy1 = min(x0, dx0), min(y0, dy0), max(x1, dx1), max(y1, dy1)
+                if (ux1 - ux0) * (uy1 - uy0) <= (x1 - x0) * (y1 - y0) + (dx1 - dx0) * (dy1 - dy0) + self.DIRTY_MERGE_SLACK_PX:
+                    x0, y0, x1, y1 = ux0, uy0, ux1, uy1
+                    del rects[i]; merged = True
+                    break
+        rects.append((x0, y0, x1, y1))
+        if self._auto_flush: self._flush_dirty()
+
+    def _flush_dirty(self):
+        """Packs and sends the pending dirty regions; with async_spi the transfers are only queued."""
+        rects, self._dirty_rects = self._dirty_rects, []
+        all_sent = True; spi_errors = self._spi_errors
+        for x0, y0, x1, y1 in rects:
+            if self._spi_q is None:
+                all_sent &= self._update_framebuffer_region(x0, y0, x1 - x0, y1 - y0); continue
+            # Horizontal strips: the writer thread clocks out strip k while strip k+1 is packed,
+            # and each strip's crop/pack buffers stay cache-sized
+            strip_rows = max(1, self.ASYNC_STRIP_BYTES // ((x1 - x0) * 2))
+            for sy in range(y0, y1, strip_rows):
+                all_sent &= self._update_framebuffer_region(x0, sy, x1 - x0, min(strip_rows, y1 - sy))
+        if all_sent and spi_errors == self._spi_errors and (0, 0, self.width, self.height) in rects:
+            self._fb565_on_panel = True # Everything fb565 holds is on the panel now
+
+    def flush(self, full=False):
+        """
+        Sends all pending framebuffer changes and returns once they have reached the display.
+        full=True resends the whole framebuffer, e.g. after writing to the panel by other means.
+        """
+        if full:
+            self._fb565_on_panel = False
+            self._dirty_rects = [(0, 0, self.width, self.height)] # Covers every pending rect
+        self._flush_dirty()
+        self._wait_spi_idle()
+
+    @contextmanager
+    def batch(self):
+        """
+        Defers hardware updates while the block runs. On exit the regions drawn inside
+        it are sent, with overlapping or nearby ones merged when their bounding box is
+        barely larger than the two regions, and far-apart ones sent separately.
+        """
+        previous = self._auto_flush
+        self._auto_flush = False
+        try:
+            yield self
+        finally:
+            self._auto_flush = previous
+            if previous: self._flush_dirty()
 
     def draw_image_rgb(self, x, y, pil_image_rgb):
         """
@@ -202,7 +523,7 @@ class GC9A01:
         if pil_image_rgb.mode != "RGB":
             pil_image_rgb = pil_image_rgb.convert("RGB")
         self.framebuffer.paste(pil_image_rgb, (x_int, y_int))
-        self._update_framebuffer_region(x_int, y_int, pil_image_rgb.width, pil_image_rgb.height)
+        self._mark_dirty(x_int, y_int, pil_image_rgb.width, pil_image_rgb.height)
 
     def draw_image_rgba_composited(self, x, y, pil_image_rgba):
         """
@@ -216,55 +537,84 @@ class GC9A01:
                 self.draw_image_rgb565(int(x), int(y), pil_image_rgba.width, pil_image_rgba.height, rgb_buffer)
             return
         
+        if pil_image_rgba.mode == "RGB": # No alpha to blend: plain copy, skipping the RGBA conversion
+            self.draw_image_rgb(x, y, pil_image_rgba); return
         if pil_image_rgba.mode != "RGBA":
             pil_image_rgba = pil_image_rgba.convert("RGBA")
 
-        img_width, img_height = pil_image_rgba.size
         x_int, y_int = int(x), int(y)
-
-        draw_x_on_screen = max(0, x_int); draw_y_on_screen = max(0, y_int)
-        src_crop_x0 = 0 if x_int >= 0 else -x_int
-        src_crop_y0 = 0 if y_int >= 0 else -y_int
-        blit_width = min(img_width - src_crop_x0, self.width - draw_x_on_screen)
-        blit_height = min(img_height - src_crop_y0, self.height - draw_y_on_screen)
-        if blit_width <= 0 or blit_height <= 0: return 
-
-        fg_cropped_rgba = pil_image_rgba.crop((src_crop_x0, src_crop_y0, src_crop_x0 + blit_width, src_crop_y0 + blit_height))
-        bg_region_rgb = self.framebuffer.crop((draw_x_on_screen, draw_y_on_screen, draw_x_on_screen + blit_width, draw_y_on_screen + blit_height))
-        bg_region_rgba = bg_region_rgb.convert("RGBA") 
-
-        composited_region_rgba = Image.alpha_composite(bg_region_rgba, fg_cropped_rgba)
-        composited_region_rgb = composited_region_rgba.convert("RGB") 
-
-        self.framebuffer.paste(composited_region_rgb, (draw_x_on_screen, draw_y_on_screen))
-        self._update_framebuffer_region(draw_x_on_screen, draw_y_on_screen, blit_width, blit_height)
+        clipped = self._clip(x_int, y_int, pil_image_rgba.width, pil_image_rgba.height, self.width, self.height)
+        if clipped is None: return
+        draw_x_on_screen, draw_y_on_screen, blit_width, blit_height = clipped[:4]
+
+        alpha_min, alpha_max = pil_image_rgba.getextrema()[3]
+        if alpha_max == 0: return # Fully transparent: nothing changes, nothing to send
+        # Using the RGBA image as its own mask blends it straight into the RGB framebuffer in C,
+        # with no background crop, mode conversions or intermediate composite image. paste()
+        # clips off-screen parts itself, so the foreground is not cropped to the screen first either.
+        # A fully opaque image needs no blending at all and is copied as-is.
+        if alpha_min == 255:
+            self.framebuffer.paste(pil_image_rgba, (x_int, y_int))
+            self._mark_dirty(draw_x_on_screen, draw_y_on_screen, blit_width, blit_height); return
+        # Only the box around non-transparent pixels can change: blend just that crop and mark just
+        # that box dirty, so a mostly empty full-screen overlay costs no more than its strokes
+        ink_x0, ink_y0, ink_x1, ink_y1 = pil_image_rgba.getbbox()
+        if (ink_x1 - ink_x0, ink_y1 - ink_y0) != pil_image_rgba.size:
+            pil_image_rgba = pil_image_rgba.crop((ink_x0, ink_y0, ink_x1, ink_y1))
+        self.framebuffer.paste(pil_image_rgba, (x_int + ink_x0, y_int + ink_y0), pil_image_rgba)
+        self._mark_dirty(x_int + ink_x0, y_int + ink_y0, ink_x1 - ink_x0, ink_y1 - ink_y0)
+
+    def draw_mask(self, x, y, mask_l, color_rgb565):
+        """
+        Paints one solid color through an "L" mode mask at (x, y): 0 leaves the framebuffer
+        as is, 255 sets the color, values in between blend. A single-color layer carries a
+        quarter of the bytes of the equivalent RGBA image, and only the box around the mask's
+        non-zero pixels is blended and sent.
+        """
+        if not _HAS_PIL or not self.framebuffer:
+            print("Error: Pillow or framebuffer not available for draw_mask().")
+            return
+        if mask_l.mode != "L": mask_l = mask_l.convert("L")
+        ink_bbox = mask_l.getbbox()
+        if ink_bbox is None: return # Empty mask: nothing changes, nothing to send
+        ink_x0, ink_y0, ink_x1, ink_y1 = ink_bbox
+        if (ink_x1 - ink_x0, ink_y1 - ink_y0) != mask_l.size: mask_l = mask_l.crop(ink_bbox)
+        x_ink, y_ink = int(x) + ink_x0, int(y) + ink_y0
+        if mask_l.getextrema() == (255, 255): # Solid block: nothing to blend, take the cached-payload fill path
+            self._fill_rect_fast(x_ink, y_ink, ink_x1 - ink_x0, ink_y1 - ink_y0, color_rgb565); return
+        self.framebuffer.paste(self._rgb565_to_rgb888_tuple(color_rgb565), (x_ink, y_ink), mask_l)
+        self._mark_dirty(x_ink, y_ink, ink_x1 - ink_x0, ink_y1 - ink_y0)
 
     def draw_image_rgb565(self, x, y, width, height, image_buffer_bytes):
         """Low-level: Draws raw RGB565 buffer to hardware. DOES NOT update software framebuffer."""
-        x_int, y_int = int(x), int(y) 
-        if x_int >= self.width or y_int >= self.height or x_int + width <= 0 or y_int + height <= 0: return
-        src_x_offset = 0; src_y_offset = 0
-        if x_int < 0: src_x_offset = -x_int
-        if y_int < 0: src_y_offset = -y_int
-        draw_x_on_screen = max(0, x_int)
-        draw_y_on_screen = max(0, y_int)
-        blit_width = min(width - src_x_offset, self.width - draw_x_on_screen)
-        blit_height = min(height - src_y_offset, self.height - draw_y_on_screen)
-        if blit_width <= 0 or blit_height <= 0: return
+        clipped = self._clip(x, y, width, height, self.width, self.height)
+        if clipped is None: return
+        draw_x_on_screen, draw_y_on_screen, blit_width, blit_height, src_x_offset, src_y_offset = clipped
         
-        self.set_window(draw_x_on_screen, draw_y_on_screen, draw_x_on_screen + blit_width - 1, draw_y_on_screen + blit_height - 1)
-        self.write_ram_prepare()
         if blit_width != width or blit_height != height or src_x_offset > 0 or src_y_offset > 0:
-            clipped_buffer = bytearray(blit_width * blit_height * 2)
-            dest_idx = 0
-            for row_idx in range(blit_height):
-                s_start = ((src_y_offset + row_idx) * width + src_x_offset) * 2
-                s_end = s_start + blit_width * 2
-                clipped_buffer[dest_idx : dest_idx + blit_width * 2] = image_buffer_bytes[s_start : s_end]
-                dest_idx += blit_width * 2
-            self._write_data(clipped_buffer)
-        else:
-            self._write_data(image_buffer_bytes)
+            if isinstance(image_buffer_bytes, list): image_buffer_bytes = bytes(image_buffer_bytes) # Slicing below needs a buffer
+            if blit_width == width:
+                # Only rows are clipped: the visible part is one contiguous run, slice it without copying
+                start = src_y_offset * width * 2
+                image_buffer_bytes = memoryview(image_buffer_bytes)[start : start + blit_height * width * 2]
+            else:
+                # The visible sub-block is gathered into the reused scratch buffer, not a fresh allocation
+                row_bytes = blit_width * 2
+                clipped_mv = memoryview(self._rgb565_scratch)[:blit_height * row_bytes]
+                if _HAS_NUMPY:
+                    # 2-D views on the bytes (2 per pixel, endianness untouched): one strided copy in C
+                    src = np.frombuffer(image_buffer_bytes, dtype=np.uint8, count=width * height * 2).reshape(height, width * 2)
+                    np.frombuffer(clipped_mv, dtype=np.uint8).reshape(blit_height, row_bytes)[...] = \
+                        src[src_y_offset : src_y_offset + blit_height, src_x_offset * 2 : src_x_offset * 2 + row_bytes]
+                else:
+                    src = memoryview(image_buffer_bytes)
+                    for row_idx in range(blit_height):
+                        s_start = ((src_y_offset + row_idx) * width + src_x_offset) * 2
+                        clipped_mv[row_idx * row_bytes : (row_idx + 1) * row_bytes] = src[s_start : s_start + row_bytes]
+                image_buffer_bytes = clipped_mv
+
+        self._send_window(draw_x_on_screen, draw_y_on_screen, draw_x_on_screen + blit_width - 1, draw_y_on_screen + blit_height - 1, image_buffer_bytes)
+        self._fb565_on_panel = False # The panel now shows pixels fb565 doesn't have
 
     # --- Standard Drawing Methods (Update SW Framebuffer & Physical Display) ---
     def pixel(self, x, y, color_rgb565):
@@ -273,7 +623,13 @@ class GC9A01:
         if not (0 <= x_int < self.width and 0 <= y_int < self.height): return
         pil_color_rgb888 = self._rgb565_to_rgb888_tuple(color_rgb565)
         self.fb_draw.point((x_int,y_int), fill=pil_color_rgb888)
-        self._update_framebuffer_region(x_int, y_int, 1, 1)
+        if not self._auto_flush:
+            self._mark_dirty(x_int, y_int, 1, 1); return
+        # Immediate single pixel: write the known RGB565 value into fb565 and send it, no crop/pack of the framebuffer
+        packed = struct.pack(">H", color_rgb565 & 0xFFFF)
+        offset = (y_int * self.width + x_int) * 2
+        self.fb565[offset:offset + 2] = packed
+        self._send_window(x_int, y_int, x_int, y_int, packed)
 
     def line(self, x0, y0, x1, y1, color_rgb565, line_width=1):
         if not _HAS_PIL or not self.framebuffer: return
@@ -286,12 +642,15 @@ class GC9A01:
         min_x = min(x0i, x1i) - padding; max_x = max(x0i, x1i) + padding
         min_y = min(y0i, y1i) - padding; max_y = max(y0i, y1i) + padding
         
-        self._update_framebuffer_region(min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
+        self._mark_dirty(min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
 
     def rectangle(self, x, y, width, height, outline_rgb565=None, fill_rgb565=None, outline_width=1):
         if not _HAS_PIL or not self.framebuffer: return
         x_int,y_int,w_int,h_int = int(x),int(y),int(width),int(height)
         if w_int<=0 or h_int<=0: return
+        if outline_rgb565 is None or outline_width <= 0:
+            if fill_rgb565 is not None: self._fill_rect_fast(x_int, y_int, w_int, h_int, fill_rgb565) # Writes fb565 directly
+            return
 
         pil_fill_rgb888 = self._rgb565_to_rgb888_tuple(fill_rgb565) if fill_rgb565 is not None else None
         pil_outline_rgb888 = self._rgb565_to_rgb888_tuple(outline_rgb565) if outline_rgb565 is not None else None
@@ -302,16 +661,51 @@ class GC9A01:
                                width=outline_width if pil_outline_rgb888 and outline_width > 0 else 0)
         
         padding = (outline_width // 2) + 1 if pil_outline_rgb888 and outline_width > 0 else 0
-        self._update_framebuffer_region(x_int - padding, y_int - padding, w_int + 2*padding, h_int + 2*padding)
+        self._mark_dirty(x_int - padding, y_int - padding, w_int + 2*padding, h_int + 2*padding)
+
+    def _fill_rect_fast(self, x, y, width, height, color_rgb565):
+        """
+        Solid fill that skips the crop + RGB565 packer: the payload is just the color's
+        two bytes repeated. Both framebuffers are still updated for later compositing.
+        Inside a batch the region is only marked dirty like any other primitive.
+        """
+        if not _HAS_PIL or not self.framebuffer or color_rgb565 is None: return # None = no fill, as with rectangle()
+        color_rgb565 &= 0xFFFF # Same masking as pixel(); the payload packer rejects wider values
+        clipped = self._clip(x, y, width, height, self.width, self.height)
+        if clipped is None: return
+        x0, y0, w, h = clipped[:4]
+        x1, y1 = x0 + w, y0 + h
+        self.fb_draw.rectangle([(x0, y0), (x1 - 1, y1 - 1)], fill=self._rgb565_to_rgb888_tuple(color_rgb565))
+        if not self._auto_flush:
+            self._mark_dirty(x0, y0, x1 - x0, y1 - y0); return
+
+        payload = memoryview(_rgb565_fill_payload(color_rgb565, self.width * self.height))[:(x1 - x0) * (y1 - y0) * 2]
+        row = payload[:(x1 - x0) * 2]
+        stride = self.width * 2
+        if x0 == 0 and x1 == self.width:
+            self.fb565[y0 * stride:y1 * stride] = payload
+        elif _HAS_NUMPY: # One strided broadcast into the fb565 view instead of a slice assignment per row
+            np.frombuffer(self.fb565, dtype='>u2').reshape(self.height, self.width)[y0:y1, x0:x1] = color_rgb565
+        else:
+            for row_y in range(y0, y1):
+                offset = row_y * stride + x0 * 2
+                self.fb565[offset:offset + len(row)] = row
+        self._send_window(x0, y0, x1 - 1, y1 - 1, payload)
+        if x1 - x0 == self.width and y1 - y0 == self.height: self._fb565_on_panel = True
 
     def fill_rect(self, x, y, width, height, color_rgb565):
-        self.rectangle(x,y,width,height,fill_rgb565=color_rgb565, outline_rgb565=None)
+        self._fill_rect_fast(x, y, width, height, color_rgb565)
 
     def fill_screen(self, color_rgb565):
-        if not _HAS_PIL or not self.framebuffer: return
-        pil_color_rgb888 = self._rgb565_to_rgb888_tuple(color_rgb565)
-        self.fb_draw.rectangle([(0,0), (self.width-1, self.height-1)], fill=pil_color_rgb888)
-        self._update_framebuffer_region(0,0,self.width,self.height)
+        self.clear(color_rgb565)
+
+    def clear(self, color_rgb565=0):
+        """
+        Fills the whole screen with one color (black by default). Any pending dirty regions
+        are dropped first: the fill covers them, so sending them too would be wasted bus time.
+        """
+        self._dirty_rects = []
+        self._fill_rect_fast(0, 0, self.width, self.height, color_rgb565)
         
     def circle(self, x_center, y_center, radius, outline_rgb565=None, fill_rgb565=None, outline_width=1):
         if not _HAS_PIL or not self.framebuffer: return
@@ -328,7 +722,7 @@ class GC9A01:
                              width=outline_width if pil_outline_rgb888 and outline_width > 0 else 0)
         
         padding = (outline_width // 2) + 1 if pil_outline_rgb888 and outline_width > 0 else 1
-        self._update_framebuffer_region(x_c-r-padding, y_c-r-padding, 2*(r+padding), 2*(r+padding))
+        self._mark_dirty(x_c-r-padding, y_c-r-padding, 2*(r+padding), 2*(r+padding))
 
     def oval(self, xy_bbox, outline_rgb565=None, fill_rgb565=None, outline_width=1):
         """
@@ -365,14 +759,14 @@ class GC9A01:
         update_width = (x1 - x0 + 1) + 2 * padding
         update_height = (y1 - y0 + 1) + 2 * padding
         
-        self._update_framebuffer_region(update_x, update_y, update_width, update_height)
+        self._mark_dirty(update_x, update_y, update_width, update_height)
 
 
     def arc(self, xy_bbox, start_angle, end_angle, color_rgb565, width=1):
         """
         Draws an arc (a portion of an ellipse's outline).
-        The arc is drawn as an RGBA image and composited onto the framebuffer
-        for correct anti-aliasing.
+        The arc is drawn into a one-byte-per-pixel "L" mask, which is then used to
+        paste the arc color into the framebuffer.
         Args:
             xy_bbox: List or tuple [x0, y0, x1, y1] defining the bounding box
                      of the ellipse from which the arc is taken.
@@ -395,7 +789,7 @@ class GC9A01:
 
         padding = (width // 2) + 2 
         
-        # Bounding box for the temporary RGBA image that will contain the arc
+        # Bounding box for the temporary mask that will contain the arc
         # This bbox is in absolute screen coordinates
         img_bbox_x0 = x0_abs - padding
         img_bbox_y0 = y0_abs - padding
@@ -407,10 +801,10 @@ class GC9A01:
 
         if img_pil_width <= 0 or img_pil_height <= 0: return
 
-        arc_rgba_img = Image.new("RGBA", (img_pil_width, img_pil_height), (0,0,0,0))
-        arc_draw_ctx = ImageDraw.Draw(arc_rgba_img)
+        arc_mask = Image.new("L", (img_pil_width, img_pil_height), 0)
+        arc_draw_ctx = ImageDraw.Draw(arc_mask)
 
-        # The arc's original bounding box (xy_bbox) needs to be relative to arc_rgba_img
+        # The arc's original bounding box (xy_bbox) needs to be relative to arc_mask
         arc_rel_x0 = x0_abs - img_bbox_x0
         arc_rel_y0 = y0_abs - img_bbox_y0
         arc_rel_x1 = x1_abs - img_bbox_x0 # This becomes arc_rel_x0 + (x1_abs - x0_abs)
@@ -418,38 +812,48 @@ class GC9A01:
         
         arc_draw_ctx.arc([(arc_rel_x0, arc_rel_y0), (arc_rel_x1, arc_rel_y1)],
                          start_angle, end_angle, 
-                         fill=pil_color_rgb888 + (255,), 
+                         fill=255, 
                          width=width)
         
-        self.draw_image_rgba_composited(img_bbox_x0, img_bbox_y0, arc_rgba_img)
+        self.draw_mask(img_bbox_x0, img_bbox_y0, arc_mask, color_rgb565)
 
 
     def text(self, x, y, text_string, font_path, font_size, text_color_rgb888, background_color_rgb888=None):
         if not _HAS_PIL or not self.framebuffer: print("Error: Pillow or framebuffer not available."); return
         x_int, y_int = int(x), int(y)
-        try: font = ImageFont.truetype(font_path, font_size)
+        try: font = _load_font(font_path, font_size)
         except IOError: print(f"Error: Font '{font_path}' not found."); return
         except Exception as e: print(f"Error loading font: {e}"); return
 
-        temp_draw = ImageDraw.Draw(Image.new("RGB",(1,1))) 
+        temp_draw = _MEASURE_DRAW
+        use_anchor = hasattr(temp_draw, 'textbbox') and hasattr(font, 'getbbox')
         try:
-            if hasattr(temp_draw, 'textbbox') and hasattr(font, 'getbbox'):
-                 bbox_local = temp_draw.textbbox((0,0),text_string,font=font,anchor="lt")
+            if use_anchor: # Font metrics straight from FreeType; no Draw object or layout pass needed
+                 bbox_local = font.getbbox(text_string, anchor="lt")
                  txt_w,txt_h = bbox_local[2]-bbox_local[0], bbox_local[3]-bbox_local[1]
+                 ink_x, ink_y = bbox_local[0], bbox_local[1]
             else: 
                 txt_w,txt_h = temp_draw.textsize(text_string,font=font)
+                ink_x, ink_y = 0, 0
+            if txt_w<=0 or txt_h<=0: return
+
+            # Rasterize the glyphs into a mask sized exactly to their bbox, then paste the
+            # text color through it; only that bbox (plus any background box) is marked dirty.
+            # Inside the try: font.getbbox() accepts multiline text, but anchored drawing rejects it.
+            glyph_mask = Image.new("L", (txt_w, txt_h), 0)
+            if use_anchor:
+                ImageDraw.Draw(glyph_mask).text((-ink_x, -ink_y), text_string, font=font, fill=255, anchor="lt")
+            else:
+                ImageDraw.Draw(glyph_mask).text((0, 0), text_string, font=font, fill=255)
         except Exception as e: print(f"Error getting text dimensions: {e}"); return
-        if txt_w<=0 or txt_h<=0: return
-        
-        if background_color_rgb888:
-            self.fb_draw.rectangle([(x_int, y_int), (x_int+txt_w-1, y_int+txt_h-1)], fill=background_color_rgb888)
-        
-        if hasattr(self.fb_draw, 'textbbox') and hasattr(font, 'getbbox'):
-            self.fb_draw.text((x_int,y_int), text_string, font=font, fill=text_color_rgb888, anchor="lt")
-        else:
-            self.fb_draw.text((x_int,y_int), text_string, font=font, fill=text_color_rgb888)
-            
-        self._update_framebuffer_region(x_int, y_int, txt_w, txt_h)
+
+        with self.batch(): # Background and glyph regions go out as one update
+            if background_color_rgb888:
+                self.fb_draw.rectangle([(x_int, y_int), (x_int+txt_w-1, y_int+txt_h-1)], fill=background_color_rgb888)
+                self._mark_dirty(x_int, y_int, txt_w, txt_h)
+            text_fill = tuple(text_color_rgb888) if isinstance(text_color_rgb888, list) else text_color_rgb888 # paste() takes tuples and color strings, not lists
+            self.framebuffer.paste(text_fill, (x_int + ink_x, y_int + ink_y), glyph_mask)
+            self._mark_dirty(x_int + ink_x, y_int + ink_y, txt_w, txt_h)
 
 
 # --- Example Usage ---
@@ -458,6 +862,8 @@ if __name__ == "__main__":
     
     CS_PIN_NUM, DC_PIN_NUM, RST_PIN_NUM, BL_PIN_NUM = 16, 12, 7, 6
     MADCTL_VALUE_TO_USE = 0x08 
+    SPI_BAUDRATE = 40000000 # Known-good on the Unihiker wiring
+    FAST_SPI_BAUDRATE = None # Opt-in: e.g. 80000000 (the GC9A01 maximum) if your wiring is short and clean enough
     FONT_PATH = "DejaVuSans-Bold.ttf" 
 
     board_initialized = False
@@ -471,11 +877,11 @@ if __name__ == "__main__":
         try:
             cs_pin = Pin(CS_PIN_NUM); dc_pin = Pin(DC_PIN_NUM, Pin.OUT); rst_pin = Pin(RST_PIN_NUM, Pin.OUT)
             bl_pin_obj = Pin(BL_PIN_NUM, Pin.OUT) if BL_PIN_NUM is not None else None
-            spi_bus = SPI(1, cs=cs_pin, baudrate=40000000, polarity=0, phase=0) 
+            spi_bus = SPI(1, cs=cs_pin, baudrate=SPI_BAUDRATE, polarity=0, phase=0)
             
             display = GC9A01(spi_bus=spi_bus, dc_pin_obj=dc_pin, rst_pin_obj=rst_pin, 
                              cs_pin_obj=None, 
-                             bl_pin_obj=bl_pin_obj, madctl_val=MADCTL_VALUE_TO_USE)
+                             bl_pin_obj=bl_pin_obj, madctl_val=MADCTL_VALUE_TO_USE, baudrate=FAST_SPI_BAUDRATE)
             display.init_display() 
             print("Display initialized.")
 
@@ -485,8 +891,9 @@ if __name__ == "__main__":
             print(f"Screen filled with RGB: {screen_bg_color_rgb}")
             time.sleep(0.5)
 
-            display.fill_rect(10,10, 50, 50, display._rgb888_tuple_to_rgb565_int((200,0,0))) 
-            display.line(5, 70, 235, 70, display._rgb888_tuple_to_rgb565_int((255,255,255)), 3) 
+            with display.batch(): # Both shapes go out together when the block ends
+                display.fill_rect(10,10, 50, 50, display._rgb888_tuple_to_rgb565_int((200,0,0))) 
+                display.line(5, 70, 235, 70, display._rgb888_tuple_to_rgb565_int((255,255,255)), 3) 
             time.sleep(0.5)
 
             circle_img_rgba = Image.new("RGBA", (100, 100), (0,0,0,0)) 
@@ -1,4 +1,3 @@
-import time
 import math 
 import os 
 from pinpong.board import Board, Pin, SPI 
@@ -28,41 +27,6 @@ except ImportError:
         print("Warning: Imported GC9A01 globally. Ensure it's the version with software framebuffer.")
 
 
-def create_line_rgba_image(x0, y0, x1, y1, line_color_rgb888_alpha, line_width):
-    """
-    Creates a Pillow RGBA image containing just a single line.
-    The line is drawn relative to the top-left of its own tight bounding box.
-    Returns the RGBA image, and its calculated top-left (x,y) position on the screen.
-    """
-    if not _HAS_PIL: return None, 0, 0
-    x0, y0, x1, y1 = int(x0), int(y0), int(x1), int(y1)
-
-    padding = (line_width // 2) + 2 
-    
-    # Absolute screen coordinates for the bounding box of this line image
-    img_screen_x0 = min(x0, x1) - padding
-    img_screen_y0 = min(y0, y1) - padding
-    img_screen_x1 = max(x0, x1) + padding
-    img_screen_y1 = max(y0, y1) + padding
-
-    img_pil_width = img_screen_x1 - img_screen_x0 + 1
-    img_pil_height = img_screen_y1 - img_screen_y0 + 1
-        
-    # Line coordinates relative to this new image's top-left corner
-    rel_x0 = x0 - img_screen_x0
-    rel_y0 = y0 - img_screen_y0
-    rel_x1 = x1 - img_screen_x0
-    rel_y1 = y1 - img_screen_y0
-
-    if img_pil_width <= 0 or img_pil_height <= 0: return None, 0, 0
-
-    line_img = Image.new("RGBA", (img_pil_width, img_pil_height), (0,0,0,0)) # Fully transparent
-    draw_context = ImageDraw.Draw(line_img)
-    draw_context.line([(rel_x0, rel_y0), (rel_x1, rel_y1)], fill=line_color_rgb888_alpha, width=line_width)
-    
-    return line_img, img_screen_x0, img_screen_y0
-
-
 # --- Main Cat Drawing Program ---
 if __name__ == "__main__":
     if not _HAS_PIL:
@@ -98,7 +62,8 @@ if __name__ == "__main__":
     if spi_bus_obj and dc_pin and rst_pin:
         display = GC9A01(spi_bus=spi_bus_obj, dc_pin_obj=dc_pin, rst_pin_obj=rst_pin,
                          cs_pin_obj=None, bl_pin_obj=bl_pin_obj,
-                         width=240, height=240, madctl_val=MADCTL_VALUE_TO_USE)
+                         width=240, height=240, madctl_val=MADCTL_VALUE_TO_USE,
+                         auto_flush=False) # Draw the whole cat in the framebuffer, then send it with one flush()
         display.init_display() # This initializes the software framebuffer
         if bl_pin_obj: display.backlight_on()
         print("Display initialized.")
@@ -115,14 +80,22 @@ if __name__ == "__main__":
     COLOR_BLACK_RGB = (0, 0, 0)            # Pupils, eye outlines
     OPAQUE_ALPHA_TUPLE = (255,) # For RGBA colors (R,G,B,A)
 
-    # Convert screen background to RGB565 for initial fill_screen
-    SCREEN_BG_565 = display._rgb888_tuple_to_rgb565_int(COLOR_SKY_BLUE_RGB)
+    # Every color is converted once here: RGB565 ints for the display methods, RGBA tuples for the sprite
+    _to565 = display._rgb888_tuple_to_rgb565_int
+    SCREEN_BG_565 = _to565(COLOR_SKY_BLUE_RGB)
+    LIGHT_GRAY_565 = _to565(COLOR_LIGHT_GRAY_RGB) # Head, body and legs fill
+    DARK_GRAY_565 = _to565(COLOR_DARK_GRAY_RGB)   # Outlines
+    PINK_565 = _to565(COLOR_PINK_RGB)
+    GREEN_565 = _to565(COLOR_GREEN_RGB)
+    BLACK_565 = _to565(COLOR_BLACK_RGB)
+    # RGBA tuples for the eye sprite, taken from the 565-quantized colors so it matches display.circle() output
+    COLOR_GREEN_RGBA = display._rgb565_to_rgb888_tuple(GREEN_565) + OPAQUE_ALPHA_TUPLE
+    COLOR_BLACK_RGBA = display._rgb565_to_rgb888_tuple(BLACK_565) + OPAQUE_ALPHA_TUPLE
 
     # --- Drawing the Cat (Revised Order) ---
     print("Drawing a cat using software framebuffer and RGBA compositing...")
-    # 1. Fill screen with overall background (updates software FB and HW)
-    display.fill_screen(SCREEN_BG_565)
-    time.sleep(0.1) 
+    # 1. Fill screen with overall background (software FB only until flush())
+    display.fill_screen(SCREEN_BG_565) # No pause needed: nothing is sent before flush(), which waits for the bus itself
 
     # --- Define Cat's Geometry ---
     head_radius = 45
@@ -136,7 +109,7 @@ if __name__ == "__main__":
 
     # 2. Tail (Drawn BEFORE Body, composited onto sky blue)
     tail_start_x = body_x + body_width -5 
-    tail_start_y = body_y + body_height * 0.6 
+    tail_start_y = body_y + body_height * 3 // 5 # Integer math keeps every tail point a whole pixel
     tail_mid_x = tail_start_x + 35
     tail_mid_y = tail_start_y - 25
     tail_end_x = tail_start_x + 25
@@ -144,106 +117,96 @@ if __name__ == "__main__":
     tail_body_width = 6
     tail_outline_width = tail_body_width + 4 
     
-    line_img, lx, ly = create_line_rgba_image(tail_start_x, tail_start_y, tail_mid_x, tail_mid_y, COLOR_DARK_GRAY_RGB + OPAQUE_ALPHA_TUPLE, tail_outline_width)
-    if line_img: display.draw_image_rgba_composited(lx, ly, line_img)
-    line_img, lx, ly = create_line_rgba_image(tail_start_x, tail_start_y, tail_mid_x, tail_mid_y, COLOR_LIGHT_GRAY_RGB + OPAQUE_ALPHA_TUPLE, tail_body_width)
-    if line_img: display.draw_image_rgba_composited(lx, ly, line_img)
-    line_img, lx, ly = create_line_rgba_image(tail_mid_x, tail_mid_y, tail_end_x, tail_end_y, COLOR_DARK_GRAY_RGB + OPAQUE_ALPHA_TUPLE, tail_outline_width - 2)
-    if line_img: display.draw_image_rgba_composited(lx, ly, line_img)
-    line_img, lx, ly = create_line_rgba_image(tail_mid_x, tail_mid_y, tail_end_x, tail_end_y, COLOR_LIGHT_GRAY_RGB + OPAQUE_ALPHA_TUPLE, tail_body_width - 2)
-    if line_img: display.draw_image_rgba_composited(lx, ly, line_img)
+    # Every overlay layer is a single color, so the strokes go into one full-screen "L" (alpha-only)
+    # mask, allocated once and cleared in place between layers, and display.draw_mask() paints the
+    # color through it. The tail needs its own layers (not part of the features layer below)
+    # because the body must cover its base.
+    overlay = Image.new("L", (display.width, display.height), 0)
+    overlay_draw = ImageDraw.Draw(overlay)
+    # The tail is one polyline with rounded joints, drawn as an outline layer with the fill layer painted
+    # on top: the layer order does the outlining, and the bend has no notch between the two segments
+    tail_points = [(tail_start_x, tail_start_y), (tail_mid_x, tail_mid_y), (tail_end_x, tail_end_y)]
+    overlay_draw.line(tail_points, fill=255, width=tail_outline_width, joint="curve")
+    display.draw_mask(0, 0, overlay, DARK_GRAY_565)
+    overlay.paste(0, (0, 0, display.width, display.height))
+    overlay_draw.line(tail_points, fill=255, width=tail_body_width, joint="curve")
+    display.draw_mask(0, 0, overlay, LIGHT_GRAY_565)
 
     # 3. Body & Legs (Opaque, drawn using standard library methods)
-    body_fill_565 = display._rgb888_tuple_to_rgb565_int(COLOR_LIGHT_GRAY_RGB)
-    body_outline_565 = display._rgb888_tuple_to_rgb565_int(COLOR_DARK_GRAY_RGB)
     display.rectangle(body_x, body_y, body_width, body_height, 
-                      fill_rgb565=body_fill_565, 
-                      outline_rgb565=body_outline_565, outline_width=2)
+                      fill_rgb565=LIGHT_GRAY_565, 
+                      outline_rgb565=DARK_GRAY_565, outline_width=2)
     leg_width = 18
     leg_height = 35
-    leg_y_start = body_y + body_height - (leg_height // 2.5) 
+    leg_y_start = body_y + body_height - leg_height * 2 // 5
     display.rectangle(body_x + 8, leg_y_start, leg_width, leg_height, 
-                      fill_rgb565=body_fill_565, outline_rgb565=body_outline_565, outline_width=2)
+                      fill_rgb565=LIGHT_GRAY_565, outline_rgb565=DARK_GRAY_565, outline_width=2)
     display.rectangle(body_x + body_width - leg_width - 8, leg_y_start, leg_width, leg_height, 
-                      fill_rgb565=body_fill_565, outline_rgb565=body_outline_565, outline_width=2)
+                      fill_rgb565=LIGHT_GRAY_565, outline_rgb565=DARK_GRAY_565, outline_width=2)
 
     # 4. Head (Opaque, drawn using standard library method. Will overlap body top.)
     display.circle(head_center_x, head_center_y, head_radius,
-                   fill_rgb565=body_fill_565, 
-                   outline_rgb565=body_outline_565, 
+                   fill_rgb565=LIGHT_GRAY_565, 
+                   outline_rgb565=DARK_GRAY_565, 
                    outline_width=2) 
 
-    # 5. Ears (Drawn AFTER Head, as RGBA images composited)
+    # 5. Ears (Drawn AFTER Head). Ears, mouth and whiskers are all dark gray, so they share one mask
+    # layer, painted once at the end; none of them overlaps the eyes or nose.
+    overlay.paste(0, (0, 0, display.width, display.height))
     ear_line_width = 2
     tip_y_factor = 1.1  
     outer_base_y_factor = 0.6 
     inner_base_y_factor = 0.45 
-    # Left Ear
-    ear_left_tip_x = head_center_x - head_radius * 0.5
-    ear_left_tip_y = head_center_y - head_radius * tip_y_factor 
-    ear_left_base_outer_x = head_center_x - head_radius * 0.8 
-    ear_left_base_outer_y = head_center_y - head_radius * outer_base_y_factor
-    ear_left_base_inner_x = head_center_x - head_radius * 0.2 
-    ear_left_base_inner_y = head_center_y - head_radius * inner_base_y_factor
-    line_img, lx, ly = create_line_rgba_image(ear_left_tip_x, ear_left_tip_y, ear_left_base_outer_x, ear_left_base_outer_y, COLOR_DARK_GRAY_RGB + OPAQUE_ALPHA_TUPLE, ear_line_width)
-    if line_img: display.draw_image_rgba_composited(lx, ly, line_img)
-    line_img, lx, ly = create_line_rgba_image(ear_left_tip_x, ear_left_tip_y, ear_left_base_inner_x, ear_left_base_inner_y, COLOR_DARK_GRAY_RGB + OPAQUE_ALPHA_TUPLE, ear_line_width)
-    if line_img: display.draw_image_rgba_composited(lx, ly, line_img)
-    line_img, lx, ly = create_line_rgba_image(ear_left_base_outer_x, ear_left_base_outer_y, ear_left_base_inner_x, ear_left_base_inner_y, COLOR_DARK_GRAY_RGB + OPAQUE_ALPHA_TUPLE, ear_line_width)
-    if line_img: display.draw_image_rgba_composited(lx, ly, line_img)
-    # Right Ear
-    ear_right_tip_x = head_center_x + head_radius * 0.5
-    ear_right_tip_y = head_center_y - head_radius * tip_y_factor
-    ear_right_base_outer_x = head_center_x + head_radius * 0.8 
-    ear_right_base_outer_y = head_center_y - head_radius * outer_base_y_factor
-    ear_right_base_inner_x = head_center_x + head_radius * 0.2 
-    ear_right_base_inner_y = head_center_y - head_radius * inner_base_y_factor
-    line_img, lx, ly = create_line_rgba_image(ear_right_tip_x, ear_right_tip_y, ear_right_base_outer_x, ear_right_base_outer_y, COLOR_DARK_GRAY_RGB + OPAQUE_ALPHA_TUPLE, ear_line_width)
-    if line_img: display.draw_image_rgba_composited(lx, ly, line_img)
-    line_img, lx, ly = create_line_rgba_image(ear_right_tip_x, ear_right_tip_y, ear_right_base_inner_x, ear_right_base_inner_y, COLOR_DARK_GRAY_RGB + OPAQUE_ALPHA_TUPLE, ear_line_width)
-    if line_img: display.draw_image_rgba_composited(lx, ly, line_img)
-    line_img, lx, ly = create_line_rgba_image(ear_right_base_outer_x, ear_right_base_outer_y, ear_right_base_inner_x, ear_right_base_inner_y, COLOR_DARK_GRAY_RGB + OPAQUE_ALPHA_TUPLE, ear_line_width)
-    if line_img: display.draw_image_rgba_composited(lx, ly, line_img)
-
-    # 6. Eyes (Opaque, drawn using standard library method on the head)
+    # Left Ear: corners resolved once to whole pixels (int() floors these positive values, as Pillow
+    # did with the floats), then its three sides drawn from one (start, end) table
+    ear_left_tip = (int(head_center_x - head_radius * 0.5), int(head_center_y - head_radius * tip_y_factor))
+    ear_left_base_outer = (int(head_center_x - head_radius * 0.8), int(head_center_y - head_radius * outer_base_y_factor))
+    ear_left_base_inner = (int(head_center_x - head_radius * 0.2), int(head_center_y - head_radius * inner_base_y_factor))
+    for p0, p1 in ((ear_left_tip, ear_left_base_outer), (ear_left_tip, ear_left_base_inner), (ear_left_base_outer, ear_left_base_inner)):
+        overlay_draw.line([p0, p1], fill=255, width=ear_line_width)
+    # Right Ear: the exact mirror of the left one across the head's center column, so copy its pixels
+    # flipped instead of rasterizing three more lines. Only the left ear is in the overlay at this point
+    ear_box = overlay.getbbox()
+    overlay.paste(overlay.crop(ear_box).transpose(Image.FLIP_LEFT_RIGHT), (2 * head_center_x + 1 - ear_box[2], ear_box[1]))
+
+    # 6. Eyes (Opaque). Both eyes are identical, so the eye + pupil is rasterized once into a small
+    # sprite and stamped at each position instead of drawing four circles into the framebuffer
     eye_radius = 10; eye_offset_x = 20; eye_offset_y = -8; pupil_radius = 4
-    eye_sclera_565 = display._rgb888_tuple_to_rgb565_int(COLOR_GREEN_RGB)
-    eye_outline_565 = display._rgb888_tuple_to_rgb565_int(COLOR_BLACK_RGB)
-    pupil_fill_565 = display._rgb888_tuple_to_rgb565_int(COLOR_BLACK_RGB)
-    display.circle(head_center_x - eye_offset_x, head_center_y + eye_offset_y, eye_radius, fill_rgb565=eye_sclera_565, outline_rgb565=eye_outline_565, outline_width=1) 
-    display.circle(head_center_x - eye_offset_x, head_center_y + eye_offset_y, pupil_radius, fill_rgb565=pupil_fill_565)    
-    display.circle(head_center_x + eye_offset_x, head_center_y + eye_offset_y, eye_radius, fill_rgb565=eye_sclera_565, outline_rgb565=eye_outline_565, outline_width=1) 
-    display.circle(head_center_x + eye_offset_x, head_center_y + eye_offset_y, pupil_radius, fill_rgb565=pupil_fill_565)    
+    eye_sprite = Image.new("RGBA", (2 * eye_radius + 1, 2 * eye_radius + 1), (0, 0, 0, 0))
+    eye_draw = ImageDraw.Draw(eye_sprite)
+    eye_draw.ellipse([(0, 0), (2 * eye_radius, 2 * eye_radius)], fill=COLOR_GREEN_RGBA, outline=COLOR_BLACK_RGBA, width=1)
+    eye_draw.ellipse([(eye_radius - pupil_radius, eye_radius - pupil_radius), (eye_radius + pupil_radius, eye_radius + pupil_radius)], fill=COLOR_BLACK_RGBA)
+    for side in (-1, 1):
+        display.draw_image_rgba_composited(head_center_x + side * eye_offset_x - eye_radius, head_center_y + eye_offset_y - eye_radius, eye_sprite)
 
     # 7. Nose (Opaque, drawn using standard library method on the head)
-    nose_radius = 6; nose_y_offset = head_radius * 0.35
-    nose_fill_565 = display._rgb888_tuple_to_rgb565_int(COLOR_PINK_RGB)
-    nose_outline_565 = display._rgb888_tuple_to_rgb565_int(COLOR_DARK_GRAY_RGB)
-    display.circle(head_center_x, head_center_y + nose_y_offset, nose_radius, fill_rgb565=nose_fill_565, outline_rgb565=nose_outline_565, outline_width=1) 
+    nose_radius = 6; nose_y_offset = head_radius * 35 // 100 # Whole pixels, so the mouth below is integer too
+    display.circle(head_center_x, head_center_y + nose_y_offset, nose_radius, fill_rgb565=PINK_565, outline_rgb565=DARK_GRAY_565, outline_width=1) 
         
-    # 8. Mouth (Drawn as RGBA images composited onto the head)
+    # 8. Mouth (Drawn into the shared overlay)
     mouth_y_base = head_center_y + nose_y_offset + nose_radius + 1
     mouth_width_half = 10; mouth_depth = 6; mouth_line_width = 2
-    line_img, lx, ly = create_line_rgba_image(head_center_x, mouth_y_base, head_center_x - mouth_width_half, mouth_y_base + mouth_depth, COLOR_DARK_GRAY_RGB + OPAQUE_ALPHA_TUPLE, mouth_line_width)
-    if line_img: display.draw_image_rgba_composited(lx, ly, line_img)
-    line_img, lx, ly = create_line_rgba_image(head_center_x, mouth_y_base, head_center_x + mouth_width_half, mouth_y_base + mouth_depth, COLOR_DARK_GRAY_RGB + OPAQUE_ALPHA_TUPLE, mouth_line_width)
-    if line_img: display.draw_image_rgba_composited(lx, ly, line_img)
+    overlay_draw.line([(head_center_x, mouth_y_base), (head_center_x - mouth_width_half, mouth_y_base + mouth_depth)], fill=255, width=mouth_line_width)
+    overlay_draw.line([(head_center_x, mouth_y_base), (head_center_x + mouth_width_half, mouth_y_base + mouth_depth)], fill=255, width=mouth_line_width)
 
-    # 9. Whiskers (Drawn as RGBA images composited onto the head)
+    # 9. Whiskers (Drawn into the shared overlay)
     whisker_len = 30; whisker_y_start_offset = head_radius * 0.25 
     whisker_x_start_offset = head_radius * 0.85; whisker_line_width = 1
     whisker_base_y_abs = head_center_y + whisker_y_start_offset
-    wh_coords = [
-        (head_center_x - whisker_x_start_offset, whisker_base_y_abs - 8, head_center_x - whisker_x_start_offset - whisker_len, whisker_base_y_abs - 12),
-        (head_center_x - whisker_x_start_offset, whisker_base_y_abs,     head_center_x - whisker_x_start_offset - whisker_len, whisker_base_y_abs),
-        (head_center_x - whisker_x_start_offset, whisker_base_y_abs + 8, head_center_x - whisker_x_start_offset - whisker_len, whisker_base_y_abs + 12),
-        (head_center_x + whisker_x_start_offset, whisker_base_y_abs - 8, head_center_x + whisker_x_start_offset + whisker_len, whisker_base_y_abs - 12),
-        (head_center_x + whisker_x_start_offset, whisker_base_y_abs,     head_center_x + whisker_x_start_offset + whisker_len, whisker_base_y_abs),
-        (head_center_x + whisker_x_start_offset, whisker_base_y_abs + 8, head_center_x + whisker_x_start_offset + whisker_len, whisker_base_y_abs + 12)
-    ]
-    for x0,y0,x1,y1 in wh_coords:
-        line_img, lx, ly = create_line_rgba_image(x0,y0,x1,y1, COLOR_DARK_GRAY_RGB + OPAQUE_ALPHA_TUPLE, whisker_line_width)
-        if line_img: display.draw_image_rgba_composited(lx, ly, line_img)
+    # Whiskers as one integer (x0, y0, x1, y1) table: three (start dy, end dy) pairs per side, mirrored
+    # around the head's center line. int() floors these positive coordinates the same way Pillow did for floats
+    whisker_y = int(whisker_base_y_abs)
+    wh_coords = tuple((int(head_center_x + side * whisker_x_start_offset), whisker_y + dy0,
+                       int(head_center_x + side * (whisker_x_start_offset + whisker_len)), whisker_y + dy1)
+                      for side in (-1, 1) for dy0, dy1 in ((-8, -12), (0, 0), (8, 12)))
+    for x0, y0, x1, y1 in wh_coords:
+        overlay_draw.line([(x0, y0), (x1, y1)], fill=255, width=whisker_line_width)
+
+    # Ears, mouth and whiskers were all drawn into one mask; paint it in a single pass
+    display.draw_mask(0, 0, overlay, DARK_GRAY_565)
+
+    # Everything above only touched the software framebuffer; push the finished cat in one transfer
+    display.flush()
                       
     print("Cat drawing complete!")
 